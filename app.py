@@ -1,41 +1,433 @@
 import os
+import csv
+import json
 import base64
 from io import BytesIO
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import uuid
+import orjson
 from werkzeug.utils import secure_filename
+from PIL import Image
 import numpy as np
 import pandas as pd
+from scipy import stats as sp_stats
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from cachetools import LRUCache
+from numba import njit, prange
+import numpy_groupies as npg
 from flask_cors import CORS
+from flask_compress import Compress
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import FileTarget
 import seaborn as sns
 import matplotlib.pyplot as plt
 import matplotlib
+from matplotlib.figure import Figure
 matplotlib.use('Agg')  # Must be before importing pyplot
 
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
+
+
+class OrjsonProvider(JSONProvider):
+    # numpy scalars/arrays and non-string dict keys serialize natively, NaN becomes null
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    @staticmethod
+    def default(obj):
+        # pandas scalars orjson doesn't know; dict keys never reach this hook
+        if obj is pd.NA or obj is pd.NaT:
+            return None
+        if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
+            return obj.isoformat()
+        raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype='application/json')
+
 
 app = Flask(__name__, static_folder='static')
+app.json = OrjsonProvider(app)
 CORS(app)
 
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'csv', 'txt'}
+UPLOAD_CHUNK_SIZE = 64 * 1024
+SCATTER_MAX_POINTS = 5000
+GROUPBY_FUNCS = {'mean': 'nanmean', 'sum': 'nansum', 'count': 'sum', 'median': None}
+# Empty groups get the same value pandas groupby reports for them
+GROUPBY_FILL = {'mean': np.nan, 'sum': 0, 'count': 0}
+MISSING_PATTERN_COLORS = np.array([[245, 245, 245], [214, 39, 40]], dtype=np.uint8)
 
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 4
+
+compress = Compress(app)
+
+# Uploaded data never changes, so per-file statistics are computed once and reused;
+# only the most recently used files keep their entries
+stats_cache = LRUCache(maxsize=8)
+stats_cache_lock = threading.Lock()
+
+# Factorized group codes hold one int per row, so only a few columns are kept at once
+group_codes_cache = LRUCache(maxsize=16)
+group_codes_cache_lock = threading.Lock()
 
-dataframes = {}
+# Per-column pandas/Arrow kernels release the GIL, so independent columns run in parallel
+column_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Rendered chart responses, keyed by request path and parameters
+chart_cache = LRUCache(maxsize=64)
+chart_cache_lock = threading.Lock()
+
+# Expensive charts are rendered off the request thread right after upload; one
+# worker keeps seaborn's pyplot figures from racing each other
+chart_executor = ThreadPoolExecutor(max_workers=1)
+chart_jobs = {}
+chart_jobs_lock = threading.Lock()
+
+# Fixed-size figures reused by each worker thread instead of reallocated per request
+_fig_tls = threading.local()
 
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def is_valid_file_id(file_id):
+    try:
+        return str(uuid.UUID(file_id)) == file_id
+    except ValueError:
+        return False
+
+
+def upload_path(file_id):
+    return os.path.join(UPLOAD_FOLDER, f'{file_id}.csv')
+
+
+def data_path(file_id):
+    return os.path.join(UPLOAD_FOLDER, f'{file_id}.arrow')
+
+
+def schema_path(file_id):
+    return os.path.join(UPLOAD_FOLDER, f'{file_id}.json')
+
+
+def is_numeric_column(series):
+    # Arrow-backed dtypes don't compare equal to the numpy scalar types
+    return (pd.api.types.is_numeric_dtype(series)
+            and not pd.api.types.is_bool_dtype(series))
+
+
+def is_categorical_column(series):
+    # Categories written to the Arrow file come back as dictionary columns
+    return (pd.api.types.is_string_dtype(series)
+            or isinstance(series.dtype, pd.CategoricalDtype)
+            or (isinstance(series.dtype, pd.ArrowDtype)
+                and pa.types.is_dictionary(series.dtype.pyarrow_dtype)))
+
+
+def categorize_strings(df):
+    # Columns with many repeated labels are stored as integer codes, which makes
+    # value_counts a histogram over codes instead of a hash over strings
+    if len(df) == 0:
+        return df
+    for col in df.columns:
+        if (pd.api.types.is_string_dtype(df[col])
+                and df[col].nunique(dropna=False) / len(df) < 0.5):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def as_numpy(series):
+    # Arrow-backed columns hold pd.NA, which matplotlib and numpy can't handle
+    if is_numeric_column(series):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy(dtype=object, na_value=np.nan)
+
+
+def numeric_matrix(df, cols, dtype=np.float32):
+    # float32 halves the bytes the numeric kernels stream through; the frame
+    # itself keeps its original dtypes for display
+    return df[cols].to_numpy(dtype=dtype, na_value=np.nan)
+
+
+def nan_corr(arr):
+    # Pearson correlation over pairwise-complete rows (same as DataFrame.corr),
+    # written as matrix products so the heavy lifting happens in BLAS
+    mask = ~np.isnan(arr)
+    x = np.where(mask, arr - np.nanmean(arr, axis=0), 0.0)
+    m = mask.astype(arr.dtype)
+
+    n = m.T @ m
+    sx = x.T @ m
+    sxx = (x * x).T @ m
+    sxy = x.T @ x
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sx.T / n
+        var = sxx - sx * sx / n
+        corr = cov / np.sqrt(var * var.T)
+
+    # A constant column leaves rounding residue in var rather than an exact 0;
+    # anything within the accumulated error of sxx counts as zero variance, as in pandas
+    flat = var <= n * np.finfo(arr.dtype).eps * sxx
+    corr[flat | flat.T] = np.nan
+
+    return np.clip(corr, -1.0, 1.0)
+
+
+@njit(parallel=True, cache=True)
+def iqr_outlier_counts(arr, lower_bounds, upper_bounds):
+    n_rows, n_cols = arr.shape
+    counts = np.zeros(n_cols, dtype=np.int64)
+    for j in prange(n_cols):
+        count = 0
+        for i in range(n_rows):
+            # NaN fails both comparisons, so missing values are never counted
+            v = arr[i, j]
+            if v < lower_bounds[j] or v > upper_bounds[j]:
+                count += 1
+        counts[j] = count
+    return counts
+
+
+def save_dataframe(file_id, df):
+    # Uncompressed Arrow IPC so every worker can memory-map the same pages
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(data_path(file_id), 'wb') as sink:
+        with ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    # Sidecar schema lets lightweight endpoints answer without reading the data
+    schema = {
+        'rows': len(df),
+        'columns': df.columns.tolist(),
+        'column_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'numeric_columns': [col for col in df.columns if is_numeric_column(df[col])],
+        'categorical_columns': [col for col in df.columns if is_categorical_column(df[col])],
+        'null_counts': {col: int(count) for col, count in df.isnull().sum().items()}
+    }
+    with open(schema_path(file_id), 'w') as f:
+        json.dump(schema, f)
+
+
+def load_schema(file_id):
+    if not is_valid_file_id(file_id) or not os.path.exists(schema_path(file_id)):
+        return None
+    with open(schema_path(file_id)) as f:
+        return json.load(f)
+
+
+def stream_upload(path):
+    if request.mimetype != 'multipart/form-data':
+        return None
+
+    # Write the file field straight to disk instead of buffering it in Werkzeug's form parser
+    parser = StreamingFormDataParser(headers=request.headers)
+    target = FileTarget(path)
+    parser.register('file', target)
+
+    while True:
+        chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        parser.data_received(chunk)
+
+    return target
+
+
+def sniff_delimiter(path):
+    with open(path, 'rb') as f:
+        head = f.read(UPLOAD_CHUNK_SIZE)
+
+    # Drop a trailing partial line so the sniffer sees consistent rows
+    if len(head) == UPLOAD_CHUNK_SIZE and b'\n' in head:
+        head = head.rsplit(b'\n', 1)[0]
+
+    try:
+        dialect = csv.Sniffer().sniff(head.decode('utf-8', errors='ignore'),
+                                      delimiters=',\t;')
+        return dialect.delimiter
+    except csv.Error:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _read_table(file_id, columns):
+    # Zero-copy: the columns stay backed by the mapped file, shared through the page cache
+    source = pa.memory_map(data_path(file_id), 'r')
+    table = ipc.open_file(source).read_all()
+    if columns:
+        table = table.select(list(columns))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def load_dataframe(file_id, columns=None):
+    return _read_table(file_id, tuple(columns) if columns else None)
+
+
+def cached_stat(file_id, key, compute):
+    with stats_cache_lock:
+        cache = stats_cache.setdefault(file_id, {})
+        if key in cache:
+            return cache[key]
+
+    value = compute()
+    with stats_cache_lock:
+        cache[key] = value
+    return value
+
+
+def get_value_counts(file_id, series):
+    return cached_stat(file_id, ('value_counts', series.name), series.value_counts)
+
+
+def get_group_codes(file_id, series):
+    key = (file_id, series.name)
+    with group_codes_cache_lock:
+        entry = group_codes_cache.get(key)
+    if entry is None:
+        entry = pd.factorize(series)
+        with group_codes_cache_lock:
+            group_codes_cache[key] = entry
+    return entry
+
+
+def get_quantiles(file_id, numeric_cols):
+    return cached_stat(file_id, 'quantiles', lambda: load_dataframe(
+        file_id, numeric_cols).quantile([0.25, 0.5, 0.75]))
+
+
+def chart_key(path, args=(), body=None):
+    return (path, tuple(sorted(args)), json.dumps(body or {}, sort_keys=True))
+
+
+def request_chart_key():
+    return chart_key(request.path, request.args.items(),
+                     request.get_json(silent=True))
+
+
+def cached_chart(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request_chart_key()
+
+        with chart_cache_lock:
+            entry = chart_cache.get(key)
+
+        if entry is None:
+            response = view(*args, **kwargs)
+
+            # Errors come back as (response, status) tuples and are never cached
+            if isinstance(response, tuple) or response.status_code != 200:
+                return response
+
+            entry = {'identity': response.get_data()}
+            with chart_cache_lock:
+                chart_cache[key] = entry
+
+        return encoded_chart_response(entry, preferred_encoding())
+    return wrapper
+
+
+def _store_chart(key, render, *args):
+    with app.app_context():
+        entry = {'identity': jsonify(render(*args)).get_data()}
+
+    with chart_cache_lock:
+        chart_cache[key] = entry
+    with chart_jobs_lock:
+        chart_jobs.pop(key, None)
+    return entry
+
+
+def schedule_chart(key, render, *args):
+    with chart_jobs_lock:
+        job = chart_jobs.get(key)
+        if job is None:
+            job = chart_executor.submit(_store_chart, key, render, *args)
+            chart_jobs[key] = job
+    return job
+
+
+def background_chart(key, render, *args):
+    # Serve a chart rendered by chart_executor, or tell the client to poll again.
+    # The job shares its key with cached_chart, so a finished render is a cache hit.
+    job = schedule_chart(key, render, *args)
+    if not job.done():
+        return jsonify({'status': 'pending'}), 202
+
+    with chart_jobs_lock:
+        chart_jobs.pop(key, None)
+    error = job.exception()
+    if error is not None:
+        return jsonify({'error': str(error)}), 500
+    return app.response_class(job.result()['identity'], mimetype='application/json')
+
+
+def preferred_encoding():
+    # Same negotiation Flask-Compress applies to uncached responses
+    algorithm = compress._choose_compress_algorithm(
+        request.headers.get('Accept-Encoding', ''))
+    return algorithm or 'identity'
+
+
+def encoded_chart_response(entry, encoding):
+    # Compressed bodies are kept next to the raw one, so repeat hits skip recompression.
+    # Flask-Compress leaves responses that already carry a Content-Encoding alone.
+    if len(entry['identity']) < app.config['COMPRESS_MIN_SIZE']:
+        encoding = 'identity'
+    if encoding not in entry:
+        raw = app.response_class(entry['identity'], mimetype='application/json')
+        entry[encoding] = compress.compress(app, raw, encoding)
+
+    response = app.response_class(entry[encoding], mimetype='application/json')
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def reusable_figure(name, figsize):
+    if not hasattr(_fig_tls, 'figures'):
+        _fig_tls.figures = {}
+
+    fig = _fig_tls.figures.get(name)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        _fig_tls.figures[name] = fig
+    else:
+        fig.clf()
+    return fig
+
+
 def fig_to_base64(fig):
     buf = BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight',
-                dpi=100, facecolor='white')
+    fig.savefig(buf, format='png', dpi=100, facecolor='white')
     buf.seek(0)
     img_str = base64.b64encode(buf.read()).decode('utf-8')
     buf.close()
@@ -43,6 +435,20 @@ def fig_to_base64(fig):
     return f"data:image/png;base64,{img_str}"
 
 
+def mask_to_base64(mask):
+    # Paint the boolean mask straight into a PNG, one flat block per cell
+    n_rows, n_cols = mask.shape
+    pixels = MISSING_PATTERN_COLORS[mask.astype(np.uint8)]
+    img = Image.fromarray(pixels, mode='RGB').resize(
+        (max(200, n_cols * 4), max(200, n_rows * 4)), Image.NEAREST)
+
+    buf = BytesIO()
+    img.save(buf, format='PNG')
+    img_str = base64.b64encode(buf.getvalue()).decode('utf-8')
+    buf.close()
+    return f"data:image/png;base64,{img_str}"
+
+
 @app.route('/')
 def index():
     return send_from_directory('static', 'index.html')
@@ -55,33 +461,45 @@ def serve_static(path):
 
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
-    if 'file' not in request.files:
-        return jsonify({'error': 'No file provided'}), 400
+    file_id = str(uuid.uuid4())
+    path = upload_path(file_id)
 
-    file = request.files['file']
-    if file.filename == '':
-        return jsonify({'error': 'No file selected'}), 400
+    try:
+        target = stream_upload(path)
+        if target is None or not os.path.exists(path):
+            return jsonify({'error': 'No file provided'}), 400
 
-    if not allowed_file(file.filename):
-        return jsonify({'error': 'File type not allowed. Use CSV or TXT files.'}), 400
+        if not target.multipart_filename:
+            return jsonify({'error': 'No file selected'}), 400
+
+        if not allowed_file(target.multipart_filename):
+            return jsonify({'error': 'File type not allowed. Use CSV or TXT files.'}), 400
+
+        return process_upload(file_id, secure_filename(target.multipart_filename), path)
+
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
 
-    try:
-        file_id = str(uuid.uuid4())
-        filename = secure_filename(file.filename)
 
+def process_upload(file_id, filename, path):
+    try:
         if filename.endswith('.csv'):
-            df = pd.read_csv(file)
+            df = pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow')
         else:
-            content = file.read().decode('utf-8')
-            file.seek(0)
-            if '\t' in content:
-                df = pd.read_csv(file, delimiter='\t')
-            elif ';' in content:
-                df = pd.read_csv(file, delimiter=';')
-            else:
-                df = pd.read_csv(file)
+            delimiter = sniff_delimiter(path) or ','
+            df = pd.read_csv(path, sep=delimiter,
+                             engine='pyarrow', dtype_backend='pyarrow')
+
+        df = categorize_strings(df)
+        save_dataframe(file_id, df)
 
-        dataframes[file_id] = df
+        numeric_cols = [col for col in df.columns if is_numeric_column(df[col])]
+        if len(numeric_cols) >= 2:
+            schedule_chart(chart_key(f'/api/correlation/{file_id}'),
+                           render_correlation, file_id, numeric_cols)
+            schedule_chart(chart_key(f'/api/pairplot/{file_id}'),
+                           render_pairplot, file_id, numeric_cols[:5])
 
         info = {
             'file_id': file_id,
@@ -90,7 +508,8 @@ def upload_file():
             'columns': len(df.columns),
             'column_names': df.columns.tolist(),
             'column_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
-            'preview': df.head(10).to_dict('records'),
+            'preview': pa.Table.from_pandas(
+                df.head(10), preserve_index=False).to_pylist(),
             'memory_usage': f"{df.memory_usage(deep=True).sum() / 1024:.2f} KB"
         }
 
@@ -102,38 +521,45 @@ def upload_file():
 
 @app.route('/api/basic-stats/<file_id>', methods=['GET'])
 def basic_stats(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    df = load_dataframe(file_id)
 
     try:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_cols = df.select_dtypes(
-            include=['object', 'category']).columns.tolist()
+        numeric_cols = schema['numeric_columns']
+        categorical_cols = schema['categorical_columns']
+
+        missing = cached_stat(file_id, 'missing', lambda: df.isnull().sum())
+        missing_pct = (missing / len(df) * 100).round(2)
+        dup_count = cached_stat(
+            file_id, 'duplicates', lambda: int(df.duplicated().sum()))
 
         stats = {
             'shape': {'rows': len(df), 'columns': len(df.columns)},
             'numeric_columns': numeric_cols,
             'categorical_columns': categorical_cols,
-            'missing_values': df.isnull().sum().to_dict(),
-            'missing_percentage': (df.isnull().sum() / len(df) * 100).round(2).to_dict(),
-            'duplicates': int(df.duplicated().sum()),
-            'duplicate_percentage': round(df.duplicated().sum() / len(df) * 100, 2)
+            'missing_values': missing.to_dict(),
+            'missing_percentage': missing_pct.to_dict(),
+            'duplicates': dup_count,
+            'duplicate_percentage': round(dup_count / len(df) * 100, 2)
         }
 
         if numeric_cols:
-            desc = df[numeric_cols].describe().round(3).to_dict()
+            desc = cached_stat(file_id, 'describe', lambda: df[numeric_cols].describe())
+            desc = desc.round(3).to_dict()
             stats['numeric_stats'] = desc
 
         if categorical_cols:
             cat_stats = {}
-            for col in categorical_cols[:10]:
-                value_counts = df[col].value_counts().head(10).to_dict()
-                unique_count = df[col].nunique()
+            cols = categorical_cols[:10]
+            all_counts = column_executor.map(
+                lambda col: get_value_counts(file_id, df[col]), cols)
+            for col, value_counts in zip(cols, all_counts):
                 cat_stats[col] = {
-                    'unique_count': unique_count,
-                    'top_values': value_counts
+                    'unique_count': len(value_counts),
+                    'top_values': value_counts.head(10).to_dict()
                 }
             stats['categorical_stats'] = cat_stats
 
@@ -144,142 +570,129 @@ def basic_stats(file_id):
 
 
 @app.route('/api/correlation/<file_id>', methods=['GET'])
+@cached_chart
 def correlation_analysis(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    numeric_cols = schema['numeric_columns']
 
-    try:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    if len(numeric_cols) < 2:
+        return jsonify({'error': 'Need at least 2 numeric columns for correlation analysis'}), 400
 
-        if len(numeric_cols) < 2:
-            return jsonify({'error': 'Need at least 2 numeric columns for correlation analysis'}), 400
+    return background_chart(request_chart_key(), render_correlation, file_id, numeric_cols)
 
-        corr_matrix = df[numeric_cols].corr().round(3)
 
-        fig, ax = plt.subplots(figsize=(10, 8))
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
-                    square=True, linewidths=0.5, ax=ax, fmt='.2f',
-                    annot_kws={'size': 8})
-        plt.title('Correlation Matrix Heatmap', fontsize=14, fontweight='bold')
-        plt.tight_layout()
+def render_correlation(file_id, numeric_cols):
+    df = load_dataframe(file_id, numeric_cols)
 
-        heatmap_img = fig_to_base64(fig)
+    arr = numeric_matrix(df, numeric_cols)
+    corr_matrix = pd.DataFrame(nan_corr(arr).astype(np.float64), index=numeric_cols,
+                               columns=numeric_cols).round(3)
 
-        strong_correlations = []
-        for i in range(len(numeric_cols)):
-            for j in range(i+1, len(numeric_cols)):
-                corr_val = corr_matrix.iloc[i, j]
-                if abs(corr_val) > 0.5:
-                    strong_correlations.append({
-                        'col1': numeric_cols[i],
-                        'col2': numeric_cols[j],
-                        'correlation': round(corr_val, 3)
-                    })
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
+                square=True, linewidths=0.5, ax=ax, fmt='.2f',
+                annot_kws={'size': 8})
+    ax.set_title('Correlation Matrix Heatmap', fontsize=14, fontweight='bold')
+    fig.tight_layout()
 
-        strong_correlations.sort(key=lambda x: abs(
-            x['correlation']), reverse=True)
+    heatmap_img = fig_to_base64(fig)
 
-        return jsonify({
-            'correlation_matrix': corr_matrix.to_dict(),
-            'heatmap': heatmap_img,
-            'strong_correlations': strong_correlations
-        })
+    rows, cols = np.triu_indices(len(numeric_cols), k=1)
+    values = corr_matrix.to_numpy()[rows, cols]
+    strong = np.abs(values) > 0.5
+    rows, cols, values = rows[strong], cols[strong], values[strong]
+    order = np.argsort(-np.abs(values), kind='stable')
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    strong_correlations = [{
+        'col1': numeric_cols[rows[k]],
+        'col2': numeric_cols[cols[k]],
+        'correlation': round(float(values[k]), 3)
+    } for k in order]
+
+    return {
+        'correlation_matrix': corr_matrix.to_dict(),
+        'heatmap': heatmap_img,
+        'strong_correlations': strong_correlations
+    }
 
 
 @app.route('/api/distribution/<file_id>/<column>', methods=['GET'])
+@cached_chart
 def distribution_analysis(file_id, column):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
-
-    if column not in df.columns:
+    if column not in schema['columns']:
         return jsonify({'error': f'Column {column} not found'}), 404
 
+    df = load_dataframe(file_id, [column])
+
     try:
         col_data = df[column].dropna()
 
-        if df[column].dtype in [np.int64, np.float64, np.int32, np.float32]:
-            fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-            axes[0].hist(col_data, bins=30, edgecolor='black',
-                         alpha=0.7, color='steelblue')
-            axes[0].set_title(
-                f'Distribution of {column}', fontsize=12, fontweight='bold')
-            axes[0].set_xlabel(column)
-            axes[0].set_ylabel('Frequency')
-            axes[0].axvline(col_data.mean(), color='red',
-                            linestyle='--', label=f'Mean: {col_data.mean():.2f}')
-            axes[0].axvline(col_data.median(), color='green',
-                            linestyle='--', label=f'Median: {col_data.median():.2f}')
-            axes[0].legend()
-
-            axes[1].boxplot(col_data, vert=True)
-            axes[1].set_title(
-                f'Box Plot of {column}', fontsize=12, fontweight='bold')
-            axes[1].set_ylabel(column)
-
-            plt.tight_layout()
-            chart_img = fig_to_base64(fig)
-
-            q1, q3 = col_data.quantile(0.25), col_data.quantile(0.75)
+        if is_numeric_column(df[column]):
+            # One float64 array feeds the moments, outlier mask and histogram
+            arr = col_data.to_numpy(dtype=np.float64)
+
+            quantiles = get_quantiles(file_id, schema['numeric_columns'])
+            q1, median, q3 = quantiles[column].tolist()
             iqr = q3 - q1
-            outliers = col_data[(col_data < q1 - 1.5*iqr)
-                                | (col_data > q3 + 1.5*iqr)]
+            outliers = arr[(arr < q1 - 1.5*iqr) | (arr > q3 + 1.5*iqr)]
+
+            # The client draws the histogram from these bins
+            counts, edges = np.histogram(arr, bins=30)
+
+            # One pass for the moments; bias=False matches pandas' skew/kurtosis
+            desc = sp_stats.describe(arr, bias=False)
+            col_min, col_max = desc.minmax
+            skewness, kurtosis = desc.skewness, desc.kurtosis
+            if col_min == col_max:
+                # With zero variance scipy's moments are rounding noise or NaN; pandas reports 0
+                skewness = 0.0 if desc.nobs >= 3 else np.nan
+                kurtosis = 0.0 if desc.nobs >= 4 else np.nan
 
             stats = {
                 'type': 'numeric',
-                'count': int(len(col_data)),
-                'mean': round(col_data.mean(), 3),
-                'median': round(col_data.median(), 3),
-                'std': round(col_data.std(), 3),
-                'min': round(col_data.min(), 3),
-                'max': round(col_data.max(), 3),
+                'count': int(desc.nobs),
+                'mean': round(float(desc.mean), 3),
+                'median': round(median, 3),
+                'std': round(float(np.sqrt(desc.variance)), 3),
+                'min': round(float(col_min), 3),
+                'max': round(float(col_max), 3),
                 'q1': round(q1, 3),
                 'q3': round(q3, 3),
-                'skewness': round(col_data.skew(), 3),
-                'kurtosis': round(col_data.kurtosis(), 3),
+                'skewness': round(float(skewness), 3),
+                'kurtosis': round(float(kurtosis), 3),
                 'outliers_count': int(len(outliers)),
-                'outliers_percentage': round(len(outliers) / len(col_data) * 100, 2)
+                'outliers_percentage': round(len(outliers) / desc.nobs * 100, 2),
+                'histogram': {
+                    'edges': edges.tolist(),
+                    'counts': counts.tolist()
+                }
             }
 
         else:
-            value_counts = col_data.value_counts().head(20)
-
-            fig, ax = plt.subplots(figsize=(12, 6))
-            bars = ax.bar(range(len(value_counts)), value_counts.values,
-                          color='steelblue', edgecolor='black')
-            ax.set_xticks(range(len(value_counts)))
-            ax.set_xticklabels(value_counts.index, rotation=45, ha='right')
-            ax.set_title(f'Value Counts of {column}',
-                         fontsize=12, fontweight='bold')
-            ax.set_xlabel(column)
-            ax.set_ylabel('Count')
-
-            for bar, val in zip(bars, value_counts.values):
-                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                        str(val), ha='center', va='bottom', fontsize=8)
-
-            plt.tight_layout()
-            chart_img = fig_to_base64(fig)
+            all_counts = get_value_counts(file_id, df[column])
+            # Labels go out as strings, dates and numbers included
+            value_counts = all_counts.head(20).rename(index=str)
 
             stats = {
                 'type': 'categorical',
                 'count': int(len(col_data)),
-                'unique': int(col_data.nunique()),
+                'unique': len(all_counts),
                 'top_value': str(col_data.mode().iloc[0]) if len(col_data.mode()) > 0 else None,
                 'top_frequency': int(value_counts.iloc[0]) if len(value_counts) > 0 else 0,
-                'value_counts': {str(k): int(v) for k, v in value_counts.to_dict().items()}
+                'value_counts': value_counts.to_dict(),
+                'top_values': list(value_counts.items())
             }
 
         return jsonify({
             'column': column,
-            'chart': chart_img,
             'stats': stats
         })
 
@@ -288,11 +701,13 @@ def distribution_analysis(file_id, column):
 
 
 @app.route('/api/scatter/<file_id>', methods=['POST'])
+@cached_chart
 def scatter_plot(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    df = load_dataframe(file_id)
     data = request.json
 
     x_col = data.get('x_column')
@@ -303,33 +718,43 @@ def scatter_plot(file_id):
         return jsonify({'error': 'Please provide x_column and y_column'}), 400
 
     try:
-        fig, ax = plt.subplots(figsize=(10, 7))
+        # Past a few thousand points extra markers only add overdraw
+        plot_df = df
+        if len(df) > SCATTER_MAX_POINTS:
+            plot_df = df.sample(SCATTER_MAX_POINTS, random_state=42)
+
+        fig = reusable_figure('scatter', (10, 7))
+        ax = fig.subplots()
 
         if hue_col and hue_col in df.columns:
-            sns.scatterplot(data=df, x=x_col, y=y_col,
+            sns.scatterplot(data=plot_df, x=x_col, y=y_col,
                             hue=hue_col, alpha=0.7, ax=ax)
-            plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+            ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         else:
-            ax.scatter(df[x_col], df[y_col], alpha=0.7,
+            ax.scatter(as_numpy(plot_df[x_col]), as_numpy(plot_df[y_col]), alpha=0.7,
                        c='steelblue', edgecolors='black', linewidth=0.5)
 
         ax.set_xlabel(x_col, fontsize=11)
         ax.set_ylabel(y_col, fontsize=11)
         ax.set_title(f'{y_col} vs {x_col}', fontsize=14, fontweight='bold')
 
-        if df[x_col].dtype in [np.int64, np.float64] and df[y_col].dtype in [np.int64, np.float64]:
-            z = np.polyfit(df[x_col].dropna(), df[y_col].dropna(), 1)
-            p = np.poly1d(z)
-            x_line = np.linspace(df[x_col].min(), df[x_col].max(), 100)
+        correlation = None
+        if is_numeric_column(df[x_col]) and is_numeric_column(df[y_col]):
+            # Trend line and correlation use every complete (x, y) pair
+            x = as_numpy(df[x_col])
+            y = as_numpy(df[y_col])
+            complete = ~(np.isnan(x) | np.isnan(y))
+            x, y = x[complete], y[complete]
+
+            p = np.poly1d(np.polyfit(x, y, 1))
+            x_line = np.linspace(x.min(), x.max(), 100)
             ax.plot(x_line, p(x_line), "r--", alpha=0.8, label='Trend line')
             ax.legend()
 
-        plt.tight_layout()
-        chart_img = fig_to_base64(fig)
+            correlation = round(float(np.corrcoef(x, y)[0, 1]), 3)
 
-        correlation = None
-        if df[x_col].dtype in [np.int64, np.float64] and df[y_col].dtype in [np.int64, np.float64]:
-            correlation = round(df[x_col].corr(df[y_col]), 3)
+        fig.tight_layout()
+        chart_img = fig_to_base64(fig)
 
         return jsonify({
             'chart': chart_img,
@@ -341,49 +766,56 @@ def scatter_plot(file_id):
 
 
 @app.route('/api/pairplot/<file_id>', methods=['GET'])
+@cached_chart
 def pairplot(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    numeric_cols = schema['numeric_columns'][:5]
 
-    try:
-        numeric_cols = df.select_dtypes(
-            include=[np.number]).columns.tolist()[:5]
+    if len(numeric_cols) < 2:
+        return jsonify({'error': 'Need at least 2 numeric columns'}), 400
 
-        if len(numeric_cols) < 2:
-            return jsonify({'error': 'Need at least 2 numeric columns'}), 400
+    return background_chart(request_chart_key(), render_pairplot, file_id, numeric_cols)
 
-        df_sample = df[numeric_cols]
-        if len(df_sample) > 1000:
-            df_sample = df_sample.sample(n=1000, random_state=42)
 
-        fig = sns.pairplot(df_sample, diag_kind='hist',
-                           plot_kws={'alpha': 0.6})
-        fig.fig.suptitle('Pair Plot of Numeric Variables',
-                         y=1.02, fontsize=14, fontweight='bold')
+def render_pairplot(file_id, numeric_cols):
+    df = load_dataframe(file_id, numeric_cols)
 
-        chart_img = fig_to_base64(fig.fig)
+    df_sample = df
+    if len(df_sample) > 1000:
+        df_sample = df_sample.sample(n=1000, random_state=42)
+    df_sample = pd.DataFrame(numeric_matrix(df_sample, numeric_cols),
+                             columns=numeric_cols)
 
-        return jsonify({
-            'chart': chart_img,
-            'columns_used': numeric_cols
-        })
+    fig = sns.pairplot(df_sample, diag_kind='hist',
+                       plot_kws={'alpha': 0.6})
+    fig.fig.suptitle('Pair Plot of Numeric Variables',
+                     fontsize=14, fontweight='bold')
+    fig.tight_layout()
 
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    chart_img = fig_to_base64(fig.fig)
+
+    return {
+        'chart': chart_img,
+        'columns_used': numeric_cols
+    }
 
 
 @app.route('/api/missing-analysis/<file_id>', methods=['GET'])
+@cached_chart
 def missing_analysis(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    df = load_dataframe(file_id)
 
     try:
-        missing = df.isnull().sum()
+        missing = cached_stat(file_id, 'missing', lambda: df.isnull().sum())
         missing_pct = (missing / len(df) * 100).round(2)
+        total_missing = int(missing.sum())
 
         cols_with_missing = missing[missing > 0].sort_values(ascending=False)
 
@@ -394,34 +826,34 @@ def missing_analysis(file_id):
                 'chart': None
             })
 
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+        # A standalone Figure stays clear of pyplot state shared with chart_executor
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
 
         colors = plt.cm.Reds(np.linspace(0.3, 0.8, len(cols_with_missing)))
-        axes[0].barh(range(len(cols_with_missing)),
-                     cols_with_missing.values, color=colors)
-        axes[0].set_yticks(range(len(cols_with_missing)))
-        axes[0].set_yticklabels(cols_with_missing.index)
-        axes[0].set_xlabel('Number of Missing Values')
-        axes[0].set_title('Missing Values by Column',
-                          fontsize=12, fontweight='bold')
-        axes[0].invert_yaxis()
-
-        df_sample = df.head(50) if len(df) > 50 else df
-        sns.heatmap(df_sample.isnull(), cbar=True,
-                    yticklabels=False, ax=axes[1], cmap='YlOrRd')
-        axes[1].set_title('Missing Values Pattern (First 50 Rows)',
-                          fontsize=12, fontweight='bold')
-
-        plt.tight_layout()
+        ax.barh(range(len(cols_with_missing)),
+                cols_with_missing.values, color=colors)
+        ax.set_yticks(range(len(cols_with_missing)))
+        ax.set_yticklabels(cols_with_missing.index)
+        ax.set_xlabel('Number of Missing Values')
+        ax.set_title('Missing Values by Column',
+                     fontsize=12, fontweight='bold')
+        ax.invert_yaxis()
+
+        fig.tight_layout()
         chart_img = fig_to_base64(fig)
 
+        pattern_img = mask_to_base64(df.head(50).isnull().to_numpy())
+
         return jsonify({
             'missing_counts': missing.to_dict(),
             'missing_percentages': missing_pct.to_dict(),
-            'total_missing': int(missing.sum()),
-            'total_missing_percentage': round(missing.sum() / (len(df) * len(df.columns)) * 100, 2),
+            'total_missing': total_missing,
+            'total_missing_percentage': round(total_missing / (len(df) * len(df.columns)) * 100, 2),
             'columns_with_missing': cols_with_missing.to_dict(),
-            'chart': chart_img
+            'chart': chart_img,
+            'pattern_chart': pattern_img,
+            'pattern_columns': df.columns.tolist()
         })
 
     except Exception as e:
@@ -429,68 +861,50 @@ def missing_analysis(file_id):
 
 
 @app.route('/api/outliers/<file_id>', methods=['GET'])
+@cached_chart
 def outlier_analysis(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    numeric_cols = schema['numeric_columns']
 
-    try:
-        numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    if len(numeric_cols) == 0:
+        return jsonify({'error': 'No numeric columns found'}), 400
 
-        if len(numeric_cols) == 0:
-            return jsonify({'error': 'No numeric columns found'}), 400
+    df = load_dataframe(file_id, numeric_cols)
 
-        outlier_info = {}
-
-        for col in numeric_cols:
-            col_data = df[col].dropna()
-            q1, q3 = col_data.quantile(0.25), col_data.quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
-
-            outliers = col_data[(col_data < lower_bound) |
-                                (col_data > upper_bound)]
+    try:
+        quantiles = get_quantiles(file_id, numeric_cols)
+        q1 = quantiles.loc[0.25, numeric_cols].to_numpy(dtype=np.float64)
+        q3 = quantiles.loc[0.75, numeric_cols].to_numpy(dtype=np.float64)
+        iqr = q3 - q1
+        lower_bounds = q1 - 1.5 * iqr
+        upper_bounds = q3 + 1.5 * iqr
+
+        # Compared against float64 quantile bounds, so rounding values to
+        # float32 would shift points across the fences
+        arr = numeric_matrix(df, numeric_cols, np.float64)
+        counts = iqr_outlier_counts(arr, lower_bounds, upper_bounds)
 
+        outlier_info = {}
+        for i, col in enumerate(numeric_cols):
+            non_null = schema['rows'] - schema['null_counts'][col]
             outlier_info[col] = {
-                'count': int(len(outliers)),
-                'percentage': round(len(outliers) / len(col_data) * 100, 2),
-                'lower_bound': round(lower_bound, 3),
-                'upper_bound': round(upper_bound, 3),
-                'iqr': round(iqr, 3)
+                'count': int(counts[i]),
+                'percentage': round(counts[i] / non_null * 100, 2),
+                'lower_bound': round(float(lower_bounds[i]), 3),
+                'upper_bound': round(float(upper_bounds[i]), 3),
+                'q1': round(float(q1[i]), 3),
+                'q3': round(float(q3[i]), 3),
+                'iqr': round(float(iqr[i]), 3)
             }
 
         cols_with_outliers = [
-            col for col, info in outlier_info.items() if info['count'] > 0][:8]
-
-        if len(cols_with_outliers) > 0:
-            n_cols = min(4, len(cols_with_outliers))
-            n_rows = (len(cols_with_outliers) + n_cols - 1) // n_cols
-
-            fig, axes = plt.subplots(
-                n_rows, n_cols, figsize=(4*n_cols, 4*n_rows))
-            axes = np.array(axes).flatten() if n_rows * n_cols > 1 else [axes]
-
-            for i, col in enumerate(cols_with_outliers):
-                axes[i].boxplot(df[col].dropna())
-                axes[i].set_title(
-                    f'{col}\n({outlier_info[col]["count"]} outliers)', fontsize=10)
-                axes[i].set_ylabel(col)
-
-            for j in range(len(cols_with_outliers), len(axes)):
-                axes[j].set_visible(False)
-
-            plt.suptitle('Outlier Detection (IQR Method)',
-                         fontsize=14, fontweight='bold', y=1.02)
-            plt.tight_layout()
-            chart_img = fig_to_base64(fig)
-        else:
-            chart_img = None
+            col for col, info in outlier_info.items() if info['count'] > 0]
 
         return jsonify({
             'outlier_info': outlier_info,
-            'chart': chart_img,
             'total_columns_with_outliers': len(cols_with_outliers)
         })
 
@@ -499,11 +913,13 @@ def outlier_analysis(file_id):
 
 
 @app.route('/api/groupby/<file_id>', methods=['POST'])
+@cached_chart
 def groupby_analysis(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    df = load_dataframe(file_id)
     data = request.json
 
     group_col = data.get('group_column')
@@ -514,37 +930,31 @@ def groupby_analysis(file_id):
         return jsonify({'error': 'Please provide group_column and value_column'}), 400
 
     try:
-        if agg_func == 'mean':
-            grouped = df.groupby(group_col)[value_col].mean()
-        elif agg_func == 'sum':
-            grouped = df.groupby(group_col)[value_col].sum()
-        elif agg_func == 'count':
-            grouped = df.groupby(group_col)[value_col].count()
-        elif agg_func == 'median':
-            grouped = df.groupby(group_col)[value_col].median()
+        if agg_func not in GROUPBY_FUNCS:
+            agg_func = 'mean'
+
+        # Group codes are hashed once per column and shared by every aggregation
+        codes, uniques = get_group_codes(file_id, df[group_col])
+        if agg_func == 'count':
+            values = df[value_col].notna().to_numpy(dtype=np.int64)
         else:
-            grouped = df.groupby(group_col)[value_col].mean()
+            values = as_numpy(df[value_col])
+
+        # Code -1 marks a missing group key, which groupby drops as well
+        keep = codes >= 0
+        if agg_func == 'median':
+            # numpy_groupies has no median kernel; grouping on int codes still skips rehashing
+            result = pd.Series(values[keep]).groupby(codes[keep]).median().reindex(
+                range(len(uniques))).to_numpy()
+        else:
+            result = npg.aggregate(codes[keep], values[keep], func=GROUPBY_FUNCS[agg_func],
+                                   size=len(uniques), fill_value=GROUPBY_FILL[agg_func])
 
+        grouped = pd.Series(result, index=uniques)
         grouped = grouped.sort_values(ascending=False).head(20)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
-        ax.bar(range(len(grouped)), grouped.values,
-               color='steelblue', edgecolor='black')
-        ax.set_xticks(range(len(grouped)))
-        ax.set_xticklabels([str(x)[:20]
-                           for x in grouped.index], rotation=45, ha='right')
-        ax.set_xlabel(group_col)
-        ax.set_ylabel(f'{agg_func.capitalize()} of {value_col}')
-        ax.set_title(f'{agg_func.capitalize()} of {value_col} by {group_col}',
-                     fontsize=12, fontweight='bold')
-
-        plt.tight_layout()
-        chart_img = fig_to_base64(fig)
-
-        return jsonify({
-            'chart': chart_img,
-            'data': {str(k): round(v, 3) if isinstance(v, float) else v for k, v in grouped.to_dict().items()}
-        })
+        # Ordered [group, value] pairs; the client draws the bar chart
+        return jsonify({'data': [[str(k), v] for k, v in grouped.round(3).items()]})
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -552,10 +962,11 @@ def groupby_analysis(file_id):
 
 @app.route('/api/data-preview/<file_id>', methods=['GET'])
 def data_preview(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
+    df = load_dataframe(file_id)
 
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
@@ -563,14 +974,9 @@ def data_preview(file_id):
     start = (page - 1) * per_page
     end = start + per_page
 
-    data = df.iloc[start:end].to_dict('records')
-
-    for row in data:
-        for key, value in row.items():
-            if pd.isna(value):
-                row[key] = None
-            elif isinstance(value, (np.integer, np.floating)):
-                row[key] = float(value)
+    # Arrow yields native Python scalars and None for nulls, no per-cell cleanup needed
+    data = pa.Table.from_pandas(
+        df.iloc[start:end], preserve_index=False).to_pylist()
 
     return jsonify({
         'data': data,
@@ -583,19 +989,19 @@ def data_preview(file_id):
 
 @app.route('/api/columns/<file_id>', methods=['GET'])
 def get_columns(file_id):
-    if file_id not in dataframes:
+    schema = load_schema(file_id)
+    if schema is None:
         return jsonify({'error': 'File not found'}), 404
 
-    df = dataframes[file_id]
-
     columns = []
-    for col in df.columns:
+    for col in schema['columns']:
+        null_count = schema['null_counts'][col]
         col_info = {
             'name': col,
-            'dtype': str(df[col].dtype),
-            'is_numeric': df[col].dtype in [np.int64, np.float64, np.int32, np.float32],
-            'non_null_count': int(df[col].count()),
-            'null_count': int(df[col].isnull().sum())
+            'dtype': schema['column_types'][col],
+            'is_numeric': col in schema['numeric_columns'],
+            'non_null_count': schema['rows'] - null_count,
+            'null_count': null_count
         }
         columns.append(col_info)
 
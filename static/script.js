@@ -9,6 +9,7 @@ let columns = [];
 let numericColumns = [];
 let categoricalColumns = [];
 let currentPage = 1;
+let charts = {};
 
 // Initialize app
 document.addEventListener('DOMContentLoaded', () => {
@@ -201,7 +202,7 @@ function renderColumnInfo(columnNames, columnTypes) {
 
     container.innerHTML = columnNames.map(col => {
         const dtype = columnTypes[col];
-        const isNumeric = dtype.includes('int') || dtype.includes('float');
+        const isNumeric = dtype.includes('int') || dtype.includes('float') || dtype.includes('double');
 
         return `
             <div class="column-item">
@@ -382,6 +383,19 @@ function setupAnalysisButtons() {
 }
 
 // Visualizations (using Python backend)
+const CHART_POLL_INTERVAL = 1000;
+const CHART_POLL_ATTEMPTS = 120;
+
+// Charts rendered in the background answer 202 until they are ready
+async function fetchBackgroundChart(url) {
+    for (let attempt = 0; attempt < CHART_POLL_ATTEMPTS; attempt++) {
+        const response = await fetch(url);
+        if (response.status !== 202) return response;
+        await new Promise(resolve => setTimeout(resolve, CHART_POLL_INTERVAL));
+    }
+    throw new Error('Chart is still rendering, please try again shortly');
+}
+
 async function generateDistribution() {
     const col = document.getElementById('dist-column').value;
     if (!col) return;
@@ -395,7 +409,7 @@ async function generateDistribution() {
 
         document.getElementById('dist-result').innerHTML = `
             <div class="chart-container">
-                <img src="${data.chart}" alt="Distribution of ${col}" style="max-width:100%; border-radius:8px;">
+                <canvas id="dist-chart"></canvas>
             </div>
             <div class="stats-summary">
                 ${data.stats.type === 'numeric' ? `
@@ -422,6 +436,16 @@ async function generateDistribution() {
                 `}
             </div>
         `;
+
+        if (data.stats.type === 'numeric') {
+            const { edges, counts } = data.stats.histogram;
+            const labels = counts.map((_, i) => formatNumber((edges[i] + edges[i + 1]) / 2));
+            renderBarChart('dist-chart', labels, counts, `Distribution of ${col}`, true);
+        } else {
+            const labels = data.stats.top_values.map(([value]) => value);
+            const counts = data.stats.top_values.map(([, count]) => count);
+            renderBarChart('dist-chart', labels, counts, `Value Counts of ${col}`);
+        }
     } catch (error) {
         showToast('Error: ' + error.message, 'error');
     } finally {
@@ -467,7 +491,7 @@ async function generateScatter() {
 async function generateCorrelation() {
     try {
         showLoading(true);
-        const response = await fetch(`${API_BASE}/api/correlation/${fileId}`);
+        const response = await fetchBackgroundChart(`${API_BASE}/api/correlation/${fileId}`);
         const data = await response.json();
 
         if (!response.ok) throw new Error(data.error);
@@ -505,7 +529,7 @@ async function generateCorrelation() {
 async function generatePairPlot() {
     try {
         showLoading(true);
-        const response = await fetch(`${API_BASE}/api/pairplot/${fileId}`);
+        const response = await fetchBackgroundChart(`${API_BASE}/api/pairplot/${fileId}`);
         const data = await response.json();
 
         if (!response.ok) throw new Error(data.error);
@@ -557,6 +581,11 @@ async function analyzeMissing() {
             <div class="chart-container">
                 <img src="${data.chart}" alt="Missing Values Analysis" style="max-width:100%; border-radius:8px;">
             </div>
+            <div class="chart-container">
+                <h4>Missing Values Pattern (First 50 Rows)</h4>
+                <img src="${data.pattern_chart}" alt="Missing Values Pattern" style="width:100%; max-width:600px; image-rendering:pixelated; border-radius:8px;">
+                <p class="helper-text">Columns left to right: ${data.pattern_columns.join(', ')}</p>
+            </div>
         `;
     } catch (error) {
         showToast('Error: ' + error.message, 'error');
@@ -588,16 +617,12 @@ async function detectOutliers() {
         }
 
         document.getElementById('outliers-result').innerHTML = `
-            ${data.chart ? `
-                <div class="chart-container">
-                    <img src="${data.chart}" alt="Outlier Detection" style="max-width:100%; border-radius:8px;">
-                </div>
-            ` : ''}
             <div class="outlier-grid">
                 ${Object.entries(outlierInfo).filter(([_, o]) => o.count > 0).map(([col, o]) => `
                     <div class="outlier-item">
                         <h5>${col}</h5>
                         <p><i class="fas fa-exclamation-triangle"></i> ${o.count} outliers (${o.percentage}%)</p>
+                        <p><small>Q1–Q3: [${formatNumber(o.q1)}, ${formatNumber(o.q3)}]</small></p>
                         <p><small>Bounds: [${formatNumber(o.lower_bound)}, ${formatNumber(o.upper_bound)}]</small></p>
                     </div>
                 `).join('')}
@@ -630,19 +655,26 @@ async function runGroupBy() {
 
         document.getElementById('groupby-result').innerHTML = `
             <div class="chart-container">
-                <img src="${data.chart}" alt="Group By Analysis" style="max-width:100%; border-radius:8px;">
+                <canvas id="groupby-chart"></canvas>
             </div>
             <div class="groupby-table">
                 <table class="data-table">
                     <thead><tr><th>${groupCol}</th><th>${aggFunc}(${aggCol})</th></tr></thead>
                     <tbody>
-                        ${Object.entries(data.data).slice(0, 20).map(([key, val]) => `
+                        ${data.data.slice(0, 20).map(([key, val]) => `
                             <tr><td>${key}</td><td>${formatNumber(val)}</td></tr>
                         `).join('')}
                     </tbody>
                 </table>
             </div>
         `;
+
+        renderBarChart(
+            'groupby-chart',
+            data.data.map(([key]) => key.slice(0, 20)),
+            data.data.map(([, val]) => val),
+            `${aggFunc} of ${aggCol} by ${groupCol}`
+        );
     } catch (error) {
         showToast('Error: ' + error.message, 'error');
     } finally {
@@ -651,6 +683,32 @@ async function runGroupBy() {
 }
 
 // Helper functions
+function renderBarChart(canvasId, labels, values, title, histogram = false) {
+    if (charts[canvasId]) charts[canvasId].destroy();
+
+    charts[canvasId] = new Chart(document.getElementById(canvasId), {
+        type: 'bar',
+        data: {
+            labels,
+            datasets: [{
+                data: values,
+                backgroundColor: 'rgba(70, 130, 180, 0.7)',
+                borderColor: '#000',
+                borderWidth: 1,
+                barPercentage: histogram ? 1.0 : 0.9,
+                categoryPercentage: histogram ? 1.0 : 0.8
+            }]
+        },
+        options: {
+            responsive: true,
+            plugins: {
+                legend: { display: false },
+                title: { display: true, text: title, font: { size: 14, weight: 'bold' } }
+            }
+        }
+    });
+}
+
 function formatNumber(num) {
     if (num === null || num === undefined) return '-';
     if (typeof num !== 'number') return num;
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app import nan_corr
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 20000
+    df = pd.DataFrame({
+        'a': rng.normal(size=n),
+        'b': rng.normal(size=n) * 3 + 7,
+        'c': 0.1,
+        'd': rng.normal(size=n),
+    })
+    df['d'] += df['a']
+
+    # Different NaN rows per column, so every pair sees its own subset
+    df.loc[rng.random(n) < 0.2, 'a'] = np.nan
+    df.loc[rng.random(n) < 0.1, 'c'] = np.nan
+    df.loc[rng.random(n) < 0.3, 'd'] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('dtype, atol', [(np.float64, 1e-12), (np.float32, 1e-5)])
+def test_matches_dataframe_corr(frame, dtype, atol):
+    expected = frame.corr().to_numpy()
+    result = nan_corr(frame.to_numpy(dtype=dtype))
+
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, atol=atol)